@@ -0,0 +1,54 @@
+"""Add pool query indexes
+
+Revision ID: 5b2e8d41a9c7
+Revises: c74fc30d550f
+Create Date: 2026-10-15 10:12:31.408215
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5b2e8d41a9c7'
+down_revision: Union[str, Sequence[str], None] = 'c74fc30d550f'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # CONCURRENTLY cannot run inside a transaction block
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_certa_users_role_is_healthy_is_locked',
+            'certa_users',
+            ['role', 'is_healthy', 'is_locked'],
+            unique=False,
+            postgresql_concurrently=True
+        )
+        op.create_index(
+            'ix_certa_users_locked_by',
+            'certa_users',
+            ['locked_by'],
+            unique=False,
+            postgresql_where=sa.text('locked_by IS NOT NULL'),
+            postgresql_concurrently=True
+        )
+        op.create_index(
+            'ix_certa_test_executions_status_created_at',
+            'certa_test_executions',
+            ['status', sa.text('created_at DESC')],
+            unique=False,
+            postgresql_concurrently=True
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_certa_test_executions_status_created_at', table_name='certa_test_executions', postgresql_concurrently=True)
+        op.drop_index('ix_certa_users_locked_by', table_name='certa_users', postgresql_concurrently=True)
+        op.drop_index('ix_certa_users_role_is_healthy_is_locked', table_name='certa_users', postgresql_concurrently=True)
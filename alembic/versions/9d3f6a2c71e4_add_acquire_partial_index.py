@@ -0,0 +1,42 @@
+"""Add partial index for user acquisition
+
+Revision ID: 9d3f6a2c71e4
+Revises: 5b2e8d41a9c7
+Create Date: 2026-10-15 14:03:52.117640
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9d3f6a2c71e4'
+down_revision: Union[str, Sequence[str], None] = '5b2e8d41a9c7'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # CONCURRENTLY cannot run inside a transaction block
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_certa_users_acquire',
+            'certa_users',
+            ['role', 'is_locked', 'is_healthy', sa.text('locked_at NULLS FIRST')],
+            unique=False,
+            postgresql_where=sa.text('is_locked = false AND is_healthy = true'),
+            postgresql_concurrently=True
+        )
+        op.drop_index('ix_certa_users_role', table_name='certa_users', postgresql_concurrently=True)
+        op.drop_index('ix_certa_users_is_locked', table_name='certa_users', postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.create_index('ix_certa_users_is_locked', 'certa_users', ['is_locked'], unique=False, postgresql_concurrently=True)
+        op.create_index('ix_certa_users_role', 'certa_users', ['role'], unique=False, postgresql_concurrently=True)
+        op.drop_index('ix_certa_users_acquire', table_name='certa_users', postgresql_concurrently=True)
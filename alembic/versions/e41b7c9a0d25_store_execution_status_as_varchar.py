@@ -0,0 +1,46 @@
+"""Store execution status as varchar
+
+Revision ID: e41b7c9a0d25
+Revises: 9d3f6a2c71e4
+Create Date: 2026-10-15 15:27:08.530914
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e41b7c9a0d25'
+down_revision: Union[str, Sequence[str], None] = '9d3f6a2c71e4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+STATUS_ENUM = sa.Enum('ACQUIRING', 'RUNNING', 'COMPLETED', 'FAILED', name='testexecutionstatus')
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.alter_column(
+        'certa_test_executions',
+        'status',
+        existing_type=STATUS_ENUM,
+        type_=sa.String(length=16),
+        existing_nullable=False,
+        postgresql_using='status::text'
+    )
+    STATUS_ENUM.drop(op.get_bind(), checkfirst=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    STATUS_ENUM.create(op.get_bind(), checkfirst=True)
+    op.alter_column(
+        'certa_test_executions',
+        'status',
+        existing_type=sa.String(length=16),
+        type_=STATUS_ENUM,
+        existing_nullable=False,
+        postgresql_using='status::testexecutionstatus'
+    )
@@ -1,48 +1,91 @@
+import base64
+import orjson
+from datetime import datetime
 from fastapi import APIRouter, Depends, HTTPException, status, Query
-from sqlalchemy.orm import Session
-from typing import List, Optional
-from core.dependencies import get_db_session
+from fastapi.responses import ORJSONResponse
+from sqlalchemy import select, func, exists, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Optional, Tuple
+from core.cache import POOL_CACHE_KEYS, invalidate
+from core.dependencies import get_db_session, get_user_pool_service
 from src.executions.execution_repository import TestExecutionRepository
-from src.users.user_repository import UserRepository
+from src.pools.pool_service import UserPoolService
 from src.executions.execution_models import TestExecution, TestExecutionStatus
+from src.users.user_models import CertaUser
 from src.executions.execution_schemas import (
     TestExecutionResponse,
     TestExecutionCreate,
-    TestExecutionDetail
+    TestExecutionDetail,
+    TestExecutionListAdapter,
+    TestExecutionPage
 )
-from src.users.user_schemas import CertaUserResponse
 
 router = APIRouter(prefix="/executions", tags=["executions"])
 
 
-@router.get("", response_model=List[TestExecutionResponse])
-def list_executions(
+def _encode_cursor(execution: TestExecution) -> str:
+    """Opaque keyset cursor carrying the (created_at, id) of the last row"""
+    raw = orjson.dumps([execution.created_at.isoformat(), execution.id])
+    return base64.urlsafe_b64encode(raw).decode()
+
+
+def _decode_cursor(cursor: str) -> Tuple[datetime, str]:
+    try:
+        created_at, execution_id = orjson.loads(base64.urlsafe_b64decode(cursor.encode()))
+        return datetime.fromisoformat(created_at), str(execution_id)
+    except (ValueError, TypeError):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor"
+        )
+
+
+@router.get("", response_model=TestExecutionPage)
+async def list_executions(
     status: Optional[TestExecutionStatus] = Query(None, description="Filter by status"),
-    skip: int = Query(0, ge=0),
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page"),
     limit: int = Query(100, ge=1, le=500),
-    session: Session = Depends(get_db_session)
+    session: AsyncSession = Depends(get_db_session)
 ):
     """
     Get list of all test executions with optional filters
     
     - **status**: Filter by execution status (ACQUIRING, RUNNING, COMPLETED, FAILED)
-    - **skip**: Number of records to skip (pagination)
+    - **cursor**: Opaque next_cursor from the previous page (keyset pagination)
     - **limit**: Maximum number of records to return
     """
-    query = session.query(TestExecution).order_by(TestExecution.created_at.desc())
+    query = select(TestExecution).order_by(TestExecution.created_at.desc(), TestExecution.id.desc())
     
     if status:
-        query = query.filter(TestExecution.status == status)
+        query = query.where(TestExecution.status == status)
+    
+    if cursor is not None:
+        # Seek on the (created_at, id) carried in the cursor instead of OFFSET;
+        # still valid if that row has since been deleted
+        cursor_created_at, cursor_id = _decode_cursor(cursor)
+        query = query.where(
+            tuple_(TestExecution.created_at, TestExecution.id) < tuple_(cursor_created_at, cursor_id)
+        )
     
-    executions = query.offset(skip).limit(limit).all()
+    result = await session.execute(query.limit(limit + 1))
+    executions = result.scalars().all()
     
-    return [TestExecutionResponse.model_validate(e) for e in executions]
+    next_cursor = None
+    if len(executions) > limit:
+        executions = executions[:limit]
+        next_cursor = _encode_cursor(executions[-1])
+    
+    page = TestExecutionPage(
+        items=TestExecutionListAdapter.validate_python(executions, from_attributes=True),
+        next_cursor=next_cursor
+    )
+    return ORJSONResponse(page.model_dump(mode="json"))
 
 
 @router.get("/{execution_id}", response_model=TestExecutionDetail)
-def get_execution(
+async def get_execution(
     execution_id: str,
-    session: Session = Depends(get_db_session)
+    session: AsyncSession = Depends(get_db_session)
 ):
     """
     Get detailed information about a specific test execution
@@ -50,9 +93,7 @@ def get_execution(
     Includes the list of users assigned to this execution
     """
     repo = TestExecutionRepository(session)
-    user_repo = UserRepository(session)
-    
-    execution = repo.get_by_id(execution_id)
+    execution = await repo.get_with_assigned_users(execution_id)
     
     if not execution:
         raise HTTPException(
@@ -60,20 +101,14 @@ def get_execution(
             detail=f"Execution with id {execution_id} not found"
         )
     
-    # Get assigned users
-    from src.users.user_models import CertaUser
-    assigned_users = session.query(CertaUser).filter(CertaUser.locked_by == execution_id).all()
-    
-    response = TestExecutionDetail.model_validate(execution)
-    response.assigned_users = [CertaUserResponse.model_validate(u) for u in assigned_users]
-    
-    return response
+    # Serialize once with orjson instead of re-validating through response_model
+    return ORJSONResponse(TestExecutionDetail.model_validate(execution).model_dump(mode="json"))
 
 
 @router.post("", response_model=TestExecutionResponse, status_code=status.HTTP_201_CREATED)
-def create_execution(
+async def create_execution(
     execution_data: TestExecutionCreate,
-    session: Session = Depends(get_db_session)
+    session: AsyncSession = Depends(get_db_session)
 ):
     """
     Create a new test execution record
@@ -86,7 +121,7 @@ def create_execution(
     repo = TestExecutionRepository(session)
     
     # Check if execution already exists
-    existing = repo.get_by_id(execution_data.id)
+    existing = await repo.get_by_id(execution_data.id)
     if existing:
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT,
@@ -94,20 +129,21 @@ def create_execution(
         )
     
     # Create execution
-    execution = repo.create_execution(
+    execution = await repo.create_execution(
         test_execution_id=execution_data.id,
         requested_roles=execution_data.requested_roles
     )
-    repo.commit()
+    await repo.commit()
     
     return TestExecutionResponse.model_validate(execution)
 
 
 @router.delete("/{execution_id}", status_code=status.HTTP_204_NO_CONTENT)
-def delete_execution(
+async def delete_execution(
     execution_id: str,
     force: bool = Query(False, description="Force delete even if users are locked"),
-    session: Session = Depends(get_db_session)
+    session: AsyncSession = Depends(get_db_session),
+    service: UserPoolService = Depends(get_user_pool_service)
 ):
     """
     Delete a test execution
@@ -115,9 +151,8 @@ def delete_execution(
     - **force**: If true, will also release any locked users
     """
     repo = TestExecutionRepository(session)
-    user_repo = UserRepository(session)
     
-    execution = repo.get_by_id(execution_id)
+    execution = await repo.get_by_id(execution_id)
     
     if not execution:
         raise HTTPException(
@@ -125,48 +160,57 @@ def delete_execution(
             detail=f"Execution with id {execution_id} not found"
         )
     
-    from src.users.user_models import CertaUser
-    locked_users = session.query(CertaUser).filter(CertaUser.locked_by == execution_id).count()
-    
-    if locked_users > 0 and not force:
-        raise HTTPException(
-            status_code=status.HTTP_409_CONFLICT,
-            detail=f"Cannot delete execution: {locked_users} users still locked. Use force=true to release them."
+    if force:
+        # Release through the pool service so waiting acquisitions are woken
+        await service.release_users(execution_id)
+    else:
+        # Only existence matters here, so stop at the first locked user
+        has_locked = await session.scalar(
+            select(exists().where(CertaUser.locked_by == execution_id))
         )
-    
-    # Release users if force=true
-    if force and locked_users > 0:
-        user_repo.release_by_test_execution(execution_id)
-    
-    repo.delete(execution)
-    repo.commit()
+        if has_locked:
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail="Cannot delete execution: users still locked. Use force=true to release them."
+            )
+    
+    await repo.delete(execution)
+    await repo.commit()
+    # Pool status and summary count executions, availability counts free users
+    await invalidate(*POOL_CACHE_KEYS)
 
 
 @router.get("/stats/summary")
-def get_execution_stats(session: Session = Depends(get_db_session)):
+async def get_execution_stats(session: AsyncSession = Depends(get_db_session)):
     """
     Get execution statistics summary
     
     Returns counts by status and average duration
     """
-    from sqlalchemy import func
-    
-    stats = session.query(
+    result = await session.execute(select(
         TestExecution.status,
         func.count(TestExecution.id).label('count'),
         func.avg(
             func.extract('epoch', TestExecution.completed_at - TestExecution.acquired_at)
         ).label('avg_duration_seconds')
-    ).group_by(TestExecution.status).all()
+    ).group_by(func.rollup(TestExecution.status)))
+    
+    # ROLLUP appends a grand-total row with a NULL status
+    float_ = float
+    by_status = []
+    append = by_status.append
+    total = 0
+    for row_status, count, avg_duration in result.tuples():
+        if row_status is None:
+            total = count
+            continue
+        append({
+            "status": row_status.value,
+            "count": count,
+            "avg_duration_seconds": float_(avg_duration) if avg_duration is not None else None
+        })
     
     return {
-        "by_status": [
-            {
-                "status": stat.status.value,
-                "count": stat.count,
-                "avg_duration_seconds": float(stat.avg_duration_seconds) if stat.avg_duration_seconds else None
-            }
-            for stat in stats
-        ],
-        "total": sum(stat.count for stat in stats)
+        "by_status": by_status,
+        "total": total
     }
\ No newline at end of file
@@ -1,7 +1,17 @@
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from fastapi.responses import ORJSONResponse
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import Dict, List
 from core.dependencies import get_db_session, get_user_pool_service
+from core.cache import (
+    AVAILABILITY_CACHE_KEY,
+    DETAILED_AVAILABILITY_CACHE_KEY,
+    POOL_CACHE_KEYS,
+    STATUS_CACHE_KEY,
+    SUMMARY_CACHE_KEY,
+    cached,
+    invalidate
+)
 from src.pools.pool_service import UserPoolService
 from src.executions.execution_schemas import (
     CertaUserAcquisitionRequest,
@@ -9,20 +19,21 @@ from src.executions.execution_schemas import (
     CertaUserReleaseRequest,
     CertaUserReleaseResponse
 )
-from src.users.user_schemas import CertaUserResponse, CertaUserAvailability
+from src.users.user_schemas import CertaUserAvailability, CertaUserListAdapter
 from src.users.user_exceptions import InsufficientUsersException
 from src.executions.execution_exceptions import UserAcquisitionTimeoutException
 from datetime import datetime
-from sqlalchemy import func
+from sqlalchemy import select, func
 from src.users.user_models import CertaUser
+from src.executions.execution_models import TestExecution, TestExecutionStatus
 
 router = APIRouter(prefix="/testdata/pool", tags=["testdata pool"])
 
 
 @router.post("/acquire", response_model=CertaUserAcquisitionResponse)
-def acquire_users(
+async def acquire_users(
     request: CertaUserAcquisitionRequest,
-    session: Session = Depends(get_db_session)
+    service: UserPoolService = Depends(get_user_pool_service)
 ):
     """
     Acquire (lock) users from the pool for a test execution
@@ -30,7 +41,8 @@ def acquire_users(
     This will:
     1. Create a test execution record (if not exists)
     2. Attempt to lock the required users
-    3. Retry with exponential backoff if users not available
+    3. If users are not available, wait for a release (bounded by
+       exponential backoff) and retry
     
     - **test_execution_id**: Unique identifier for the test
     - **role_requirements**: Dictionary mapping roles to required counts
@@ -45,21 +57,20 @@ def acquire_users(
     }
 ```
     """
-    service = get_user_pool_service(session)
-    
     try:
-        users = service.acquire_users(
+        users = await service.acquire_users(
             test_execution_id=request.test_execution_id,
             role_requirements=request.role_requirements,
             max_retries=request.max_retries
         )
+        await invalidate(*POOL_CACHE_KEYS)
         
-        return CertaUserAcquisitionResponse(
+        return ORJSONResponse(CertaUserAcquisitionResponse(
             test_execution_id=request.test_execution_id,
-            users=[CertaUserResponse.model_validate(u) for u in users],
+            users=CertaUserListAdapter.validate_python(users, from_attributes=True),
             acquired_at=datetime.utcnow(),
             status="success"
-        )
+        ).model_dump(mode="json"))
         
     except InsufficientUsersException as e:
         raise HTTPException(
@@ -79,9 +90,9 @@ def acquire_users(
 
 
 @router.post("/release", response_model=CertaUserReleaseResponse)
-def release_users(
+async def release_users(
     request: CertaUserReleaseRequest,
-    session: Session = Depends(get_db_session)
+    service: UserPoolService = Depends(get_user_pool_service)
 ):
     """
     Release (unlock) users locked by a test execution
@@ -99,9 +110,8 @@ def release_users(
     }
 ```
     """
-    service = get_user_pool_service(session)
-    
-    released_count = service.release_users(request.test_execution_id)
+    released_count = await service.release_users(request.test_execution_id)
+    await invalidate(*POOL_CACHE_KEYS)
     
     if released_count == 0:
         raise HTTPException(
@@ -117,7 +127,8 @@ def release_users(
 
 
 @router.get("/availability", response_model=Dict[str, int])
-def get_availability(session: Session = Depends(get_db_session)):
+@cached(AVAILABILITY_CACHE_KEY)
+async def get_availability(service: UserPoolService = Depends(get_user_pool_service)):
     """
     Get count of available (unlocked) users by role
     
@@ -132,37 +143,57 @@ def get_availability(session: Session = Depends(get_db_session)):
     }
 ```
     """
-    service = get_user_pool_service(session)
-    return service.get_availability()
+    return await service.get_availability()
+
+
+@router.get("/summary", response_model=Dict[str, Dict[str, int]])
+@cached(SUMMARY_CACHE_KEY)
+async def get_pool_summary(service: UserPoolService = Depends(get_user_pool_service)):
+    """
+    Get available users by role and test executions by status
+    
+    Both maps come back from a single query
+    
+    Example response:
+```json
+    {
+        "availability": {"client": 5, "vendor": 3},
+        "executions": {"running": 2, "completed": 14}
+    }
+```
+    """
+    return await service.get_pool_summary()
 
 
 @router.get("/availability/detailed", response_model=List[CertaUserAvailability])
-def get_detailed_availability(session: Session = Depends(get_db_session)):
+@cached(DETAILED_AVAILABILITY_CACHE_KEY)
+async def get_detailed_availability(session: AsyncSession = Depends(get_db_session)):
     """
     Get detailed availability statistics by role
     
     Returns counts of available, locked, and total users for each role
     """
-    result = session.query(
+    result = await session.execute(select(
         CertaUser.role,
         func.count(CertaUser.id).label('total_count'),
-        func.sum(func.cast(CertaUser.is_locked, func.INTEGER)).label('locked_count'),
-        func.sum(func.cast(~CertaUser.is_locked, func.INTEGER)).label('available_count')
-    ).filter(CertaUser.is_healthy == True).group_by(CertaUser.role).all()
+        func.count(CertaUser.id).filter(CertaUser.is_locked == True).label('locked_count'),
+        func.count(CertaUser.id).filter(CertaUser.is_locked == False).label('available_count')
+    ).where(CertaUser.is_healthy == True).group_by(CertaUser.role))
     
     return [
         CertaUserAvailability(
             role=row.role,
             total_count=row.total_count,
-            locked_count=row.locked_count or 0,
-            available_count=row.available_count or 0
+            locked_count=row.locked_count,
+            available_count=row.available_count
         )
         for row in result
     ]
 
 
 @router.get("/status")
-def get_pool_status(session: Session = Depends(get_db_session)):
+@cached(STATUS_CACHE_KEY)
+async def get_pool_status(session: AsyncSession = Depends(get_db_session)):
     """
     Get overall pool status
     
@@ -173,14 +204,18 @@ def get_pool_status(session: Session = Depends(get_db_session)):
     - Unhealthy users count
     - Active executions count
     """
-    total_users = session.query(func.count(CertaUser.id)).scalar()
-    locked_users = session.query(func.count(CertaUser.id)).filter(CertaUser.is_locked == True).scalar()
-    unhealthy_users = session.query(func.count(CertaUser.id)).filter(CertaUser.is_healthy == False).scalar()
-    
-    from src.executions.execution_models  import TestExecution, TestExecutionStatus
-    active_executions = session.query(func.count(TestExecution.id)).filter(
+    active_executions = select(func.count(TestExecution.id)).where(
         TestExecution.status.in_([TestExecutionStatus.ACQUIRING, TestExecutionStatus.RUNNING])
-    ).scalar()
+    ).scalar_subquery()
+    
+    # All counters in a single round-trip
+    result = await session.execute(select(
+        func.count(CertaUser.id).label('total_users'),
+        func.count(CertaUser.id).filter(CertaUser.is_locked == True).label('locked_users'),
+        func.count(CertaUser.id).filter(CertaUser.is_healthy == False).label('unhealthy_users'),
+        active_executions.label('active_executions')
+    ))
+    total_users, locked_users, unhealthy_users, active_executions = result.one()
     
     return {
         "total_users": total_users,
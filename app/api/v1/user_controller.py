@@ -1,23 +1,32 @@
 from fastapi import APIRouter, Depends, HTTPException, status, Query
-from sqlalchemy.orm import Session
+from fastapi.responses import ORJSONResponse
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List, Optional
+from core.cache import POOL_CACHE_KEYS, invalidate
 from core.dependencies import get_db_session
 from src.users.user_repository import UserRepository
 from src.users.user_models import CertaUser
-from src.users.user_schemas import CertaUserResponse, CertaUserCreate, CertaUserUpdate
+from src.users.user_schemas import (
+    CertaUserResponse,
+    CertaUserCreate,
+    CertaUserUpdate,
+    CertaUserListAdapter,
+    CertaUserPage
+)
 from datetime import datetime
 
 router = APIRouter(prefix="/users", tags=["users"])
 
 
-@router.get("", response_model=List[CertaUserResponse])
-def list_users(
+@router.get("", response_model=CertaUserPage)
+async def list_users(
     role: Optional[str] = Query(None, description="Filter by role"),
     is_locked: Optional[bool] = Query(None, description="Filter by lock status"),
     is_healthy: Optional[bool] = Query(None, description="Filter by health status"),
-    skip: int = Query(0, ge=0),
+    cursor: Optional[int] = Query(None, description="next_cursor from the previous page"),
     limit: int = Query(100, ge=1, le=500),
-    session: Session = Depends(get_db_session)
+    session: AsyncSession = Depends(get_db_session)
 ):
     """
     Get list of all users with optional filters
@@ -25,35 +34,67 @@ def list_users(
     - **role**: Filter by user role (client, vendor, admin, etc.)
     - **is_locked**: Filter by lock status
     - **is_healthy**: Filter by health status
-    - **skip**: Number of records to skip (pagination)
+    - **cursor**: Return users after this id (keyset pagination)
     - **limit**: Maximum number of records to return
     """
-    repo = UserRepository(session)
-    
-    query = session.query(CertaUser)
+    query = select(CertaUser).order_by(CertaUser.id)
     
     # Apply filters
     if role:
-        query = query.filter(CertaUser.role == role)
+        query = query.where(CertaUser.role == role)
     if is_locked is not None:
-        query = query.filter(CertaUser.is_locked == is_locked)
+        query = query.where(CertaUser.is_locked == is_locked)
     if is_healthy is not None:
-        query = query.filter(CertaUser.is_healthy == is_healthy)
+        query = query.where(CertaUser.is_healthy == is_healthy)
+    
+    # Keyset pagination: seek past the cursor on the primary key index,
+    # fetching one extra row to know whether another page exists
+    if cursor is not None:
+        query = query.where(CertaUser.id > cursor)
+    
+    result = await session.execute(query.limit(limit + 1))
+    users = result.scalars().all()
+    
+    next_cursor = None
+    if len(users) > limit:
+        users = users[:limit]
+        next_cursor = users[-1].id
+    
+    page = CertaUserPage(
+        items=CertaUserListAdapter.validate_python(users, from_attributes=True),
+        next_cursor=next_cursor
+    )
+    # Already validated: return the response directly so FastAPI does not
+    # re-validate and re-encode it against response_model
+    return ORJSONResponse(page.model_dump(mode="json"))
+
+
+@router.get("/by-email/{email}", response_model=CertaUserResponse)
+async def get_user_by_email(
+    email: str,
+    session: AsyncSession = Depends(get_db_session)
+):
+    """Get a user by email address"""
+    result = await session.execute(select(CertaUser).where(CertaUser.email == email))
+    user = result.scalar_one_or_none()
     
-    # Pagination
-    users = query.offset(skip).limit(limit).all()
+    if not user:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"User with email {email} not found"
+        )
     
-    return [CertaUserResponse.model_validate(u) for u in users]
+    return CertaUserResponse.model_validate(user)
 
 
 @router.get("/{user_id}", response_model=CertaUserResponse)
-def get_user(
+async def get_user(
     user_id: int,
-    session: Session = Depends(get_db_session)
+    session: AsyncSession = Depends(get_db_session)
 ):
     """Get a specific user by ID"""
     repo = UserRepository(session)
-    user = repo.get(user_id)
+    user = await repo.get(user_id)
     
     if not user:
         raise HTTPException(
@@ -65,9 +106,9 @@ def get_user(
 
 
 @router.post("", response_model=CertaUserResponse, status_code=status.HTTP_201_CREATED)
-def create_user(
+async def create_user(
     user_data: CertaUserCreate,
-    session: Session = Depends(get_db_session)
+    session: AsyncSession = Depends(get_db_session)
 ):
     """
     Create a new user
@@ -82,8 +123,8 @@ def create_user(
     repo = UserRepository(session)
     
     # Check if email already exists
-    existing = session.query(CertaUser).filter(CertaUser.email == user_data.email).first()
-    if existing:
+    existing_id = await session.scalar(select(CertaUser.id).where(CertaUser.email == user_data.email))
+    if existing_id is not None:
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT,
             detail=f"User with email {user_data.email} already exists"
@@ -91,17 +132,18 @@ def create_user(
     
     # Create user
     user = CertaUser(**user_data.model_dump())
-    created_user = repo.create(user)
-    repo.commit()
+    created_user = await repo.create(user)
+    await repo.commit()
+    await invalidate(*POOL_CACHE_KEYS)
     
     return CertaUserResponse.model_validate(created_user)
 
 
 @router.put("/{user_id}", response_model=CertaUserResponse)
-def update_user(
+async def update_user(
     user_id: int,
     user_data: CertaUserUpdate,
-    session: Session = Depends(get_db_session)
+    session: AsyncSession = Depends(get_db_session)
 ):
     """
     Update an existing user
@@ -109,7 +151,7 @@ def update_user(
     Only provided fields will be updated (partial update)
     """
     repo = UserRepository(session)
-    user = repo.get(user_id)
+    user = await repo.get(user_id)
     
     if not user:
         raise HTTPException(
@@ -122,16 +164,17 @@ def update_user(
     for field, value in update_data.items():
         setattr(user, field, value)
     
-    updated_user = repo.update(user)
-    repo.commit()
+    updated_user = await repo.update(user)
+    await repo.commit()
+    await invalidate(*POOL_CACHE_KEYS)
     
     return CertaUserResponse.model_validate(updated_user)
 
 
 @router.delete("/{user_id}", status_code=status.HTTP_204_NO_CONTENT)
-def delete_user(
+async def delete_user(
     user_id: int,
-    session: Session = Depends(get_db_session)
+    session: AsyncSession = Depends(get_db_session)
 ):
     """
     Delete a user
@@ -139,7 +182,7 @@ def delete_user(
     Note: Cannot delete a user that is currently locked
     """
     repo = UserRepository(session)
-    user = repo.get(user_id)
+    user = await repo.get(user_id)
     
     if not user:
         raise HTTPException(
@@ -153,39 +196,29 @@ def delete_user(
             detail=f"Cannot delete user {user_id}: currently locked by {user.locked_by}"
         )
     
-    repo.delete(user)
-    repo.commit()
-
-
-@router.get("/{email}", response_model=CertaUserResponse)
-def get_user_by_email(
-    email: str,
-    session: Session = Depends(get_db_session)
-):
-    """Get a user by email address"""
-    user = session.query(CertaUser).filter(CertaUser.email == email).first()
-    
-    if not user:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"User with email {email} not found"
-        )
-    
-    return CertaUserResponse.model_validate(user)
+    await repo.delete(user)
+    await repo.commit()
+    await invalidate(*POOL_CACHE_KEYS)
 
 
 @router.post("/bulk", response_model=List[CertaUserResponse], status_code=status.HTTP_201_CREATED)
-def create_users_bulk(
+async def create_users_bulk(
     users_data: List[CertaUserCreate],
-    session: Session = Depends(get_db_session)
+    skip_existing: bool = Query(False, description="Skip emails that already exist instead of failing"),
+    session: AsyncSession = Depends(get_db_session)
 ):
     """
     Create multiple users at once
     
     Useful for initial setup or bulk imports
+    
+    - **skip_existing**: If true, users whose email already exists are skipped
+      and only the newly created users are returned
     """
     repo = UserRepository(session)
-    created_users = []
+    
+    if not users_data:
+        return []
     
     # Check for duplicate emails in request
     emails = [u.email for u in users_data]
@@ -196,20 +229,22 @@ def create_users_bulk(
         )
     
     # Check for existing emails
-    existing = session.query(CertaUser.email).filter(CertaUser.email.in_(emails)).all()
-    if existing:
-        existing_emails = [e[0] for e in existing]
-        raise HTTPException(
-            status_code=status.HTTP_409_CONFLICT,
-            detail=f"Users already exist with emails: {existing_emails}"
-        )
-    
-    # Create all users
-    for user_data in users_data:
-        user = CertaUser(**user_data.model_dump())
-        created_user = repo.create(user)
-        created_users.append(created_user)
-    
-    repo.commit()
-    
-    return [CertaUserResponse.model_validate(u) for u in created_users]
\ No newline at end of file
+    if not skip_existing:
+        result = await session.execute(select(CertaUser.email).where(CertaUser.email.in_(emails)))
+        existing = result.all()
+        if existing:
+            existing_emails = [e[0] for e in existing]
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail=f"Users already exist with emails: {existing_emails}"
+            )
+    
+    # Create all users in a single INSERT
+    created_users = await repo.create_many(
+        [u.model_dump() for u in users_data],
+        skip_existing=skip_existing
+    )
+    await repo.commit()
+    await invalidate(*POOL_CACHE_KEYS)
+    
+    return CertaUserListAdapter.validate_python(created_users, from_attributes=True)
\ No newline at end of file
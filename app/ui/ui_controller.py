@@ -1,77 +1,152 @@
 from fastapi import APIRouter, Request, Depends, HTTPException, status, Form
-from fastapi.responses import HTMLResponse
-from fastapi.templating import Jinja2Templates
-from sqlalchemy.orm import Session
-from core.dependencies import get_db_session
+from fastapi.responses import HTMLResponse, Response
+from sqlalchemy import select, func
+from sqlalchemy.ext.asyncio import AsyncSession
+from hashlib import blake2b
+from typing import Tuple
+from core.cache import POOL_CACHE_KEYS, invalidate
+from core.dependencies import get_db_session, templates
 from src.users.user_repository import UserRepository
 from src.users.user_models import CertaUser
-from src.users.user_schemas import CertaUserResponse
+from src.users.user_schemas import CertaUserResponse, CertaUserListAdapter
 
 router = APIRouter()
-templates = Jinja2Templates(directory="templates")
 
+# Values HTML checkboxes / form fields use for "on"
+_TRUTHY = frozenset({"on", "true", "1", "yes"})
+
+
+def _as_bool(value) -> bool:
+    return value in _TRUTHY
+
+
+async def _user_counts(session: AsyncSession) -> dict:
+    """Total/busy/free user counts in a single query"""
+    result = await session.execute(select(
+        func.count(CertaUser.id),
+        func.count(CertaUser.id).filter(CertaUser.is_locked == True)
+    ))
+    total, busy = result.one()
+    return {"total": total, "busy": busy, "free": total - busy}
+
+
+async def _user_snapshot(session: AsyncSession) -> Tuple[dict, str]:
+    """
+    User counts plus an ETag for the users table, in a single query
+
+    The ETag covers row count, lock count, highest id and latest update, so
+    any insert, delete, edit, lock or release produces a new value.
+    """
+    result = await session.execute(select(
+        func.count(CertaUser.id),
+        func.count(CertaUser.id).filter(CertaUser.is_locked == True),
+        func.max(CertaUser.id),
+        func.max(CertaUser.updated_at)
+    ))
+    row = tuple(result.one())
+    total, busy = row[0], row[1]
+    etag = '"%s"' % blake2b(repr(row).encode(), digest_size=8).hexdigest()
+    return {"total": total, "busy": busy, "free": total - busy}, etag
+
+
+def _not_modified(request: Request, etag: str) -> bool:
+    return request.headers.get("if-none-match") == etag
+
+
+def _cache_headers(etag: str) -> dict:
+    # no-cache: clients may store the page but must revalidate with the ETag
+    return {"ETag": etag, "Cache-Control": "no-cache"}
+
+
+def _dump_users(users) -> list:
+    """Convert ORM users to template-ready dicts in one pass"""
+    return CertaUserListAdapter.dump_python(
+        CertaUserListAdapter.validate_python(users, from_attributes=True)
+    )
 
-@router.get("/ui", response_class=HTMLResponse)
-def home(request: Request, session: Session = Depends(get_db_session)):
-    # counts
-    total = session.query(CertaUser).count()
-    busy = session.query(CertaUser).filter(CertaUser.is_locked == True).count()
-    free = total - busy
 
-    users = session.query(CertaUser).order_by(CertaUser.id).limit(200).all()
-    users_data = [CertaUserResponse.model_validate(u).model_dump() for u in users]
+async def _fetch_users(session: AsyncSession, limit: int = 500, batch_size: int = 100) -> list:
+    """
+    Load the users table as dicts, streaming rows from a server-side cursor
 
+    Only `batch_size` ORM objects are alive at a time; each batch is
+    converted and released before the next one is fetched.
+    """
+    result = await session.stream_scalars(
+        select(CertaUser)
+        .order_by(CertaUser.id)
+        .limit(limit)
+        .execution_options(yield_per=batch_size)
+    )
+    users_data = []
+    async for batch in result.partitions():
+        users_data.extend(_dump_users(batch))
+    return users_data
+
+
+async def _ui_payload(session: AsyncSession, limit: int = 500) -> dict:
+    """Counts plus users list for templates that re-render the whole table"""
+    return {"counts": await _user_counts(session), "users": await _fetch_users(session, limit=limit)}
+
+
+@router.get("/ui", response_class=HTMLResponse)
+async def home(request: Request, session: AsyncSession = Depends(get_db_session)):
     return templates.TemplateResponse(
         "index.html",
-        {"request": request, "counts": {"total": total, "busy": busy, "free": free}, "users": users_data},
+        {"request": request, **await _ui_payload(session, limit=200)},
     )
 
 
 @router.get("/ui/users", response_class=HTMLResponse)
-def users_table(request: Request, session: Session = Depends(get_db_session)):
-    users = session.query(CertaUser).order_by(CertaUser.id).limit(500).all()
-    users_data = [CertaUserResponse.model_validate(u).model_dump() for u in users]
-    return templates.TemplateResponse("_users_table.html", {"request": request, "users": users_data})
+async def users_table(request: Request, session: AsyncSession = Depends(get_db_session)):
+    _, etag = await _user_snapshot(session)
+    if _not_modified(request, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=_cache_headers(etag))
+
+    users_data = await _fetch_users(session)
+    return templates.TemplateResponse(
+        "_users_table.html",
+        {"request": request, "users": users_data},
+        headers=_cache_headers(etag),
+    )
 
 
 @router.get("/ui/refresh", response_class=HTMLResponse)
-def refresh(request: Request, session: Session = Depends(get_db_session)):
-    total = session.query(CertaUser).count()
-    busy = session.query(CertaUser).filter(CertaUser.is_locked == True).count()
-    free = total - busy
+async def refresh(request: Request, session: AsyncSession = Depends(get_db_session)):
+    counts, etag = await _user_snapshot(session)
+    if _not_modified(request, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=_cache_headers(etag))
 
-    users = session.query(CertaUser).order_by(CertaUser.id).limit(500).all()
-    users_data = [CertaUserResponse.model_validate(u).model_dump() for u in users]
+    users_data = await _fetch_users(session)
 
     return templates.TemplateResponse(
         "_users_and_counts.html",
-        {"request": request, "counts": {"total": total, "busy": busy, "free": free}, "users": users_data},
+        {"request": request, "counts": counts, "users": users_data},
+        headers=_cache_headers(etag),
     )
 
 
 @router.get("/ui/user/{user_id}", response_class=HTMLResponse)
-def user_detail(request: Request, user_id: int, session: Session = Depends(get_db_session)):
+async def user_detail(request: Request, user_id: int, session: AsyncSession = Depends(get_db_session)):
     repo = UserRepository(session)
-    user = repo.get(user_id)
+    user = await repo.get(user_id)
     if not user:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found")
     user_data = CertaUserResponse.model_validate(user).model_dump()
 
-    total = session.query(CertaUser).count()
-    busy = session.query(CertaUser).filter(CertaUser.is_locked == True).count()
-    free = total - busy
+    counts = await _user_counts(session)
 
     return templates.TemplateResponse(
         "_detail_and_counts.html",
-        {"request": request, "user": user_data, "counts": {"total": total, "busy": busy, "free": free}},
+        {"request": request, "user": user_data, "counts": counts},
     )
 
 
 @router.post("/ui/user/{user_id}/update", response_class=HTMLResponse)
-async def user_update(request: Request, user_id: int, session: Session = Depends(get_db_session)):
+async def user_update(request: Request, user_id: int, session: AsyncSession = Depends(get_db_session)):
     form = await request.form()
     repo = UserRepository(session)
-    user = repo.get(user_id)
+    user = await repo.get(user_id)
     if not user:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found")
 
@@ -83,33 +158,27 @@ async def user_update(request: Request, user_id: int, session: Session = Depends
 
     if role is not None:
         user.role = role
-    user.is_locked = True if is_locked in ("on", "true", "1") else False
-    user.is_healthy = True if is_healthy in ("on", "true", "1") else False
+    user.is_locked = _as_bool(is_locked)
+    user.is_healthy = _as_bool(is_healthy)
     if tags is not None:
         user.tags = tags
 
-    updated = repo.update(user)
-    repo.commit()
+    updated = await repo.update(user)
+    await repo.commit()
+    await invalidate(*POOL_CACHE_KEYS)
 
     # recompute counts and fresh users list
-    total = session.query(CertaUser).count()
-    busy = session.query(CertaUser).filter(CertaUser.is_locked == True).count()
-    free = total - busy
-
-    users = session.query(CertaUser).order_by(CertaUser.id).limit(500).all()
-    users_data = [CertaUserResponse.model_validate(u).model_dump() for u in users]
-
     user_data = CertaUserResponse.model_validate(updated).model_dump()
     return templates.TemplateResponse(
         "_detail_and_counts_and_users.html",
-        {"request": request, "user": user_data, "users": users_data, "counts": {"total": total, "busy": busy, "free": free}},
+        {"request": request, "user": user_data, **await _ui_payload(session)},
     )
 
 
 @router.post("/ui/user/{user_id}/delete", response_class=HTMLResponse)
-def user_delete(request: Request, user_id: int, session: Session = Depends(get_db_session)):
+async def user_delete(request: Request, user_id: int, session: AsyncSession = Depends(get_db_session)):
     repo = UserRepository(session)
-    user = repo.get(user_id)
+    user = await repo.get(user_id)
     if not user:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found")
 
@@ -121,19 +190,12 @@ def user_delete(request: Request, user_id: int, session: Session = Depends(get_d
             status_code=status.HTTP_409_CONFLICT,
         )
 
-    repo.delete(user)
-    repo.commit()
-
-    # recompute counts and fresh users list
-    total = session.query(CertaUser).count()
-    busy = session.query(CertaUser).filter(CertaUser.is_locked == True).count()
-    free = total - busy
-
-    users = session.query(CertaUser).order_by(CertaUser.id).limit(500).all()
-    users_data = [CertaUserResponse.model_validate(u).model_dump() for u in users]
+    await repo.delete(user)
+    await repo.commit()
+    await invalidate(*POOL_CACHE_KEYS)
 
     # Return the cleared detail pane plus a fresh users table and counts (full swap via OOB on users-container)
     return templates.TemplateResponse(
         "_detail_and_counts_and_users.html",
-        {"request": request, "user": {}, "users": users_data, "counts": {"total": total, "busy": busy, "free": free}},
+        {"request": request, "user": {}, **await _ui_payload(session)},
     )
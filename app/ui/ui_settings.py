@@ -1,12 +1,11 @@
 # small independent module for settings page placeholder
 
 from fastapi import APIRouter, Request
-from fastapi.templating import Jinja2Templates
+from core.dependencies import templates
 
 router = APIRouter()
-templates = Jinja2Templates(directory="templates")
 
 
 @router.get("/ui/settings")
-def settings_page(request: Request):
+async def settings_page(request: Request):
     return templates.TemplateResponse("_settings.html", {"request": request})
@@ -0,0 +1,96 @@
+import logging
+import orjson
+from functools import lru_cache, wraps
+from typing import Optional
+from fastapi import Response
+from fastapi.encoders import jsonable_encoder
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+from core.settings import get_settings
+
+settings = get_settings()
+
+logger = logging.getLogger(__name__)
+
+# Cached pool reads; any write that changes user or execution counts
+# invalidates POOL_CACHE_KEYS
+AVAILABILITY_CACHE_KEY = "pool:availability"
+DETAILED_AVAILABILITY_CACHE_KEY = "pool:availability:detailed"
+STATUS_CACHE_KEY = "pool:status"
+SUMMARY_CACHE_KEY = "pool:summary"
+POOL_CACHE_KEYS = (AVAILABILITY_CACHE_KEY, DETAILED_AVAILABILITY_CACHE_KEY, STATUS_CACHE_KEY, SUMMARY_CACHE_KEY)
+
+# Set after the first Redis failure is logged; later ones only go to debug
+_redis_error_logged = False
+
+
+@lru_cache()
+def get_redis() -> Optional[Redis]:
+    """Get cached Redis client (None when redis_url is not configured)"""
+    if not settings.redis_url:
+        return None
+    return Redis.from_url(
+        settings.redis_url,
+        socket_timeout=settings.redis_timeout_seconds,
+        socket_connect_timeout=settings.redis_timeout_seconds
+    )
+
+
+def log_redis_error(message: str, error: RedisError) -> None:
+    """Warn about the first Redis failure, then log the rest at debug level"""
+    global _redis_error_logged
+    if _redis_error_logged:
+        logger.debug(f"{message}: {error}")
+        return
+    _redis_error_logged = True
+    logger.warning(f"{message}: {error} (further Redis errors are logged at debug level)")
+
+
+def cached(key: str, ttl: Optional[int] = None):
+    """
+    Cache the JSON body of an async endpoint in Redis
+
+    The endpoint is only called on a cache miss; hits are returned as raw
+    JSON without touching the database. Without redis_url the endpoint is
+    called directly; Redis errors fall back to calling the endpoint so the
+    cache never takes the API down.
+
+    Args:
+        key: Redis key for the cached body
+        ttl: Expiry in seconds (defaults to settings.pool_cache_ttl_seconds)
+    """
+    def decorator(func):
+        @wraps(func)
+        async def wrapper(*args, **kwargs):
+            redis = get_redis()
+            if redis is None:
+                return await func(*args, **kwargs)
+
+            try:
+                body = await redis.get(key)
+            except RedisError as e:
+                log_redis_error(f"Cache read failed for {key}", e)
+                body = None
+
+            if body is None:
+                result = await func(*args, **kwargs)
+                body = orjson.dumps(jsonable_encoder(result))
+                try:
+                    await redis.setex(key, ttl or settings.pool_cache_ttl_seconds, body)
+                except RedisError as e:
+                    log_redis_error(f"Cache write failed for {key}", e)
+
+            return Response(content=body, media_type="application/json")
+        return wrapper
+    return decorator
+
+
+async def invalidate(*keys: str) -> None:
+    """Drop cached entries so the next read hits the database"""
+    redis = get_redis()
+    if redis is None:
+        return
+    try:
+        await redis.delete(*keys)
+    except RedisError as e:
+        log_redis_error(f"Cache invalidation failed for {keys}", e)
@@ -1,7 +1,7 @@
-from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker, Session
-from contextlib import contextmanager
+from contextlib import asynccontextmanager
+from functools import lru_cache
 from core.settings import get_settings
 
 settings = get_settings()
@@ -10,44 +10,44 @@ Base = declarative_base()
 
 class Database:
     def __init__(self):
-        self.engine = create_engine(
-            settings.database_url,
+        self.engine = create_async_engine(
+            settings.async_database_url,
+            connect_args=settings.async_connect_args,
             pool_pre_ping=settings.db_pool_pre_ping,
             pool_size=settings.db_pool_size,
             max_overflow=settings.db_max_overflow,
+            pool_timeout=settings.db_pool_timeout,
+            pool_recycle=settings.db_pool_recycle,
             echo=settings.debug  # Log SQL queries in debug mode
         )
-        self.SessionLocal = sessionmaker(
-            autocommit=False,
+        self.SessionLocal = async_sessionmaker(
+            bind=self.engine,
             autoflush=False,
-            bind=self.engine
+            expire_on_commit=False  # Objects are serialized after commit; avoid implicit reloads
         )
     
-    def get_session(self) -> Session:
+    def get_session(self) -> AsyncSession:
         """Get a new database session"""
         return self.SessionLocal()
     
-    @contextmanager
-    def session_scope(self):
-        """Provide a transactional scope"""
-        session = self.get_session()
-        try:
+    @asynccontextmanager
+    async def session_scope(self):
+        """Provide a transactional scope (commit on success, rollback on error)"""
+        async with self.SessionLocal.begin() as session:
             yield session
-            session.commit()
-        except Exception:
-            session.rollback()
-            raise
-        finally:
-            session.close()
     
-    def create_all(self):
+    async def create_all(self):
         """Create all tables"""
-        Base.metadata.create_all(bind=self.engine)
+        async with self.engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
     
-    def drop_all(self):
+    async def drop_all(self):
         """Drop all tables (use with caution!)"""
-        Base.metadata.drop_all(bind=self.engine)
+        async with self.engine.begin() as conn:
+            await conn.run_sync(Base.metadata.drop_all)
 
 
-# Singleton instance
-db = Database()
\ No newline at end of file
+@lru_cache()
+def get_db() -> Database:
+    """Get the lazily created Database instance (built per worker, after fork)"""
+    return Database()
\ No newline at end of file
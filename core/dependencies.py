@@ -1,20 +1,37 @@
-from typing import Generator
-from sqlalchemy.orm import Session
-from core.database import db
+from typing import AsyncGenerator
+from fastapi import Depends
+from fastapi.templating import Jinja2Templates
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader, select_autoescape
+from sqlalchemy.ext.asyncio import AsyncSession
+from core.database import get_db
+from core.settings import get_settings
 from src.pools.pool_service import UserPoolService
 
+settings = get_settings()
 
-def get_db_session() -> Generator[Session, None, None]:
+# Shared by all UI routers. Templates are compiled once per worker and the
+# bytecode is cached on disk; file mtimes are only checked in debug mode.
+# cache_size comfortably exceeds the template count so nothing is evicted.
+templates = Jinja2Templates(env=Environment(
+    loader=FileSystemLoader("templates"),
+    autoescape=select_autoescape(["html"]),
+    bytecode_cache=FileSystemBytecodeCache(),
+    auto_reload=settings.debug,
+    cache_size=400
+))
+
+
+async def get_db_session() -> AsyncGenerator[AsyncSession, None]:
     """Dependency for database session"""
-    session = db.get_session()
+    session = get_db().get_session()
     try:
         yield session
     finally:
-        session.close()
+        await session.close()
 
 
-def get_user_pool_service(
-    session: Session = None
+async def get_user_pool_service(
+    session: AsyncSession = Depends(get_db_session)
 ) -> UserPoolService:
-    """Dependency for user pool service"""
+    """Dependency for user pool service (async so it skips the threadpool)"""
     return UserPoolService(session)
\ No newline at end of file
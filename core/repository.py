@@ -1,11 +1,12 @@
-from typing import List, Optional, Any
-from sqlalchemy.orm import Session
+from typing import Any, Iterable, List, Optional
+from sqlalchemy import inspect, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
 from core.database import Base
 
 class BaseRepository:
     """Base repository for common CRUD operations"""
     
-    def __init__(self, model, session: Session):
+    def __init__(self, model, session: AsyncSession):
         """
         Args:
             model: SQLAlchemy model class
@@ -14,35 +15,60 @@ class BaseRepository:
         self.model = model
         self.session = session
     
-    def get(self, id: int) -> Optional[Any]:
+    async def get(self, id: int) -> Optional[Any]:
         """Get entity by ID"""
-        return self.session.query(self.model).filter(self.model.id == id).first()
+        return await self.session.get(self.model, id)
     
-    def get_all(self) -> List[Any]:
+    async def get_all(self) -> List[Any]:
         """Get all entities"""
-        return self.session.query(self.model).all()
+        result = await self.session.execute(select(self.model))
+        return result.scalars().all()
     
-    def create(self, entity: Any) -> Any:
+    async def create(self, entity: Any) -> Any:
         """Create new entity"""
         self.session.add(entity)
-        self.session.flush()
+        await self.session.flush()
         return entity
     
-    def update(self, entity: Any) -> Any:
-        """Update entity"""
-        self.session.merge(entity)
-        self.session.flush()
+    async def update(self, entity: Any, exclude: Iterable[str] = ("created_at",)) -> Any:
+        """
+        Update entity
+
+        Attached entities are flushed as-is; detached ones are written with a
+        single UPDATE by primary key instead of merge()'s SELECT-then-UPDATE
+
+        Args:
+            entity: Entity to persist
+            exclude: Attributes never written for detached entities
+        """
+        if entity in self.session:
+            await self.session.flush()
+            return entity
+        
+        # Skip excluded attributes (created_at keeps its stored value) and
+        # onupdate columns, so updated_at gets its fresh default
+        columns = inspect(self.model).columns.items()
+        await self.session.execute(
+            update(self.model)
+            .where(*(column == getattr(entity, key) for key, column in columns if column.primary_key))
+            .values({
+                key: getattr(entity, key)
+                for key, column in columns
+                if not (column.primary_key or column.onupdate is not None or key in exclude)
+            })
+            .execution_options(synchronize_session=False)
+        )
         return entity
     
-    def delete(self, entity: Any) -> None:
+    async def delete(self, entity: Any) -> None:
         """Delete entity"""
-        self.session.delete(entity)
-        self.session.flush()
+        await self.session.delete(entity)
+        await self.session.flush()
     
-    def commit(self) -> None:
+    async def commit(self) -> None:
         """Commit transaction"""
-        self.session.commit()
+        await self.session.commit()
     
-    def rollback(self) -> None:
+    async def rollback(self) -> None:
         """Rollback transaction"""
-        self.session.rollback()
\ No newline at end of file
+        await self.session.rollback()
\ No newline at end of file
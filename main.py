@@ -1,10 +1,11 @@
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.templating import Jinja2Templates
+from fastapi.responses import ORJSONResponse
 from app.api.v1 import user_controller, execution_controller, pool_controller
 from app.ui import ui_controller, ui_settings
-from core.database import Base, db
-from core.settings import get_settings
+from core.database import get_db
+from core.cache import get_redis
+from core.settings import get_cors_kwargs, get_settings
 import logging
 
 settings = get_settings()
@@ -21,17 +22,12 @@ app = FastAPI(
     title=settings.app_name,
     description="An Orchestration & User Pool Management for Certa Test Automation",
     version=settings.app_version,
-    debug=settings.debug
+    debug=settings.debug,
+    default_response_class=ORJSONResponse
 )
 
 # CORS middleware
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=settings.allowed_origins,
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
+app.add_middleware(CORSMiddleware, **get_cors_kwargs())
 
 # Include routers
 app.include_router(user_controller.router, prefix="/api/v1")
@@ -41,27 +37,27 @@ app.include_router(pool_controller.router, prefix="/api/v1")
 app.include_router(ui_controller.router)
 app.include_router(ui_settings.router)
 
-# Templates
-templates = Jinja2Templates(directory="templates")
-
-
 @app.on_event("startup")
-def startup_event():
-    """Initialize database on startup"""
+async def startup_event():
+    """Log startup; the schema is applied out of band by `alembic upgrade head`"""
     logger.info(f"Starting {settings.app_name} v{settings.app_version}")
     logger.info(f"Database: {settings.database_url.split('@')[1]}")
-    Base.metadata.create_all(bind=db.engine)
-    logger.info("Database tables created")
+    if not settings.redis_url:
+        logger.info("REDIS_URL not set: response caching and pool release notifications are disabled")
 
 
 @app.on_event("shutdown")
-def shutdown_event():
+async def shutdown_event():
     """Cleanup on shutdown"""
     logger.info("Shutting down application")
+    redis = get_redis()
+    if redis is not None:
+        await redis.aclose()
+    await get_db().engine.dispose()
 
 
 @app.get("/health")
-def health_check():
+async def health_check():
     return {
         "status": "healthy",
         "service": settings.app_name,
@@ -73,6 +69,6 @@ from fastapi.responses import RedirectResponse
 
 
 @app.get("/")
-def root():
+async def root():
     # Redirect to the UI homepage
     return RedirectResponse(url='/ui')
\ No newline at end of file
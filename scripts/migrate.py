@@ -0,0 +1,43 @@
+"""
+Apply database migrations before the API starts
+
+Databases created by the old create_all-on-startup code already have the
+tables but no alembic_version table, so `alembic upgrade head` would re-run
+the initial revision and fail. Those databases are stamped at the initial
+revision once, then upgraded normally.
+"""
+import os
+import sys
+
+from alembic import command
+from alembic.config import Config
+from sqlalchemy import create_engine, inspect
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(ROOT)
+
+from core.settings import get_settings
+
+# Revision matching the schema create_all produced before migrations ran on deploy
+INITIAL_REVISION = "c74fc30d550f"
+
+
+def main() -> None:
+    os.chdir(ROOT)  # alembic.ini paths are relative to the project root
+    config = Config("alembic.ini")
+
+    engine = create_engine(get_settings().database_url)
+    try:
+        tables = set(inspect(engine).get_table_names())
+    finally:
+        engine.dispose()
+
+    if "certa_users" in tables and "alembic_version" not in tables:
+        print(f"Existing schema without alembic_version; stamping {INITIAL_REVISION}")
+        command.stamp(config, INITIAL_REVISION)
+
+    command.upgrade(config, "head")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,7 +1,9 @@
-from sqlalchemy import Column, String, DateTime, Enum as SQLEnum
+from sqlalchemy import Column, String, DateTime, Index, Enum as SQLEnum
 from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from core.database import Base
+from src.users.user_models import CertaUser
 from enum import Enum
 from typing import Dict
 from datetime import datetime
@@ -16,11 +18,13 @@ class TestExecutionStatus(str, Enum):
 
 class TestExecution(Base):
     __tablename__ = "certa_test_executions"
+    __mapper_args__ = {"eager_defaults": True}
     
     id = Column(String(255), primary_key=True)
     requested_roles = Column(JSONB, nullable=False)
+    # Stored as VARCHAR (enum names) rather than a Postgres ENUM type
     status = Column(
-        SQLEnum(TestExecutionStatus),
+        SQLEnum(TestExecutionStatus, native_enum=False, length=16),
         default=TestExecutionStatus.ACQUIRING,
         nullable=False
     )
@@ -28,6 +32,16 @@ class TestExecution(Base):
     acquired_at = Column(DateTime(timezone=True), nullable=True)
     completed_at = Column(DateTime(timezone=True), nullable=True)
     
+    # Users currently locked by this execution (no FK; joined on locked_by).
+    # Load explicitly with selectinload; implicit lazy loads cannot run on
+    # an AsyncSession, so fail loudly instead
+    assigned_users = relationship(
+        CertaUser,
+        primaryjoin="foreign(CertaUser.locked_by) == TestExecution.id",
+        viewonly=True,
+        lazy="raise_on_sql"
+    )
+    
     def mark_acquiring(self) -> None:
         """Mark test as acquiring users"""
         self.status = TestExecutionStatus.ACQUIRING
@@ -55,4 +69,12 @@ class TestExecution(Base):
         return 0.0
     
     def __repr__(self) -> str:
-        return f"<TestExecution(id={self.id}, status={self.status})>"
\ No newline at end of file
+        return f"<TestExecution(id={self.id}, status={self.status})>"
+
+
+# Serves list_executions: optional status filter, newest first
+Index(
+    "ix_certa_test_executions_status_created_at",
+    TestExecution.status,
+    TestExecution.created_at.desc()
+)
\ No newline at end of file
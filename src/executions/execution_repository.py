@@ -1,22 +1,29 @@
 from typing import Optional
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
 from core.repository import BaseRepository
 from src.executions.execution_models import TestExecution
 
 
 class TestExecutionRepository(BaseRepository):
-    def __init__(self, session: Session):
+    def __init__(self, session: AsyncSession):
         super().__init__(TestExecution, session)
     
-    def get_by_id(self, test_execution_id: str) -> Optional[TestExecution]:
+    async def get_by_id(self, test_execution_id: str) -> Optional[TestExecution]:
         """Get test execution by ID"""
-        return (
-            self.session.query(TestExecution)
-            .filter(TestExecution.id == test_execution_id)
-            .first()
+        return await self.session.get(TestExecution, test_execution_id)
+    
+    async def get_with_assigned_users(self, test_execution_id: str) -> Optional[TestExecution]:
+        """Get test execution by ID with its assigned users batch-loaded"""
+        result = await self.session.execute(
+            select(TestExecution)
+            .where(TestExecution.id == test_execution_id)
+            .options(selectinload(TestExecution.assigned_users))
         )
+        return result.scalar_one_or_none()
     
-    def create_execution(
+    async def create_execution(
         self,
         test_execution_id: str,
         requested_roles: dict
@@ -27,4 +34,4 @@ class TestExecutionRepository(BaseRepository):
             requested_roles=requested_roles
         )
         execution.mark_acquiring()
-        return self.create(execution)
\ No newline at end of file
+        return await self.create(execution)
\ No newline at end of file
@@ -1,4 +1,4 @@
-from pydantic import BaseModel, Field, ConfigDict
+from pydantic import BaseModel, Field, ConfigDict, TypeAdapter, computed_field
 from typing import Dict, List, Optional
 from datetime import datetime
 from src.executions.execution_models import TestExecutionStatus
@@ -27,11 +27,20 @@ class TestExecutionResponse(TestExecutionBase):
     completed_at: Optional[datetime] = None
 
 
+TestExecutionListAdapter = TypeAdapter(List[TestExecutionResponse])
+
+
+class TestExecutionPage(BaseModel):
+    """Keyset-paginated executions; pass next_cursor back as `cursor`"""
+    items: List[TestExecutionResponse]
+    next_cursor: Optional[str] = None
+
+
 class TestExecutionDetail(TestExecutionResponse):
     """Execution details with assigned users"""
     assigned_users: List[CertaUserResponse] = []
-    duration_seconds: Optional[float] = None
     
+    @computed_field
     @property
     def duration_seconds(self) -> Optional[float]:
         if self.acquired_at and self.completed_at:
@@ -1,25 +1,56 @@
-import time
+import asyncio
 import random
-from typing import Dict, List
-from sqlalchemy.orm import Session
+from collections import Counter
+from typing import Dict, List, Optional
+from redis.asyncio.client import PubSub
+from redis.exceptions import RedisError
+from sqlalchemy import text
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.ext.asyncio import AsyncSession
 from src.users.user_models import CertaUser
-from src.executions.execution_models import TestExecution
+from src.executions.execution_models import TestExecution, TestExecutionStatus
 from src.users.user_repository import UserRepository
 from src.executions.execution_repository import TestExecutionRepository
 from src.users.user_exceptions import InsufficientUsersException
 from src.executions.execution_exceptions import UserAcquisitionTimeoutException
+from core.cache import get_redis, log_redis_error
 from core.settings import get_settings
 
 settings = get_settings()
 
+# Published after users are released so waiting acquisitions retry immediately
+POOL_RELEASE_CHANNEL = "pool:release"
+
+# Availability by role and executions by status, aggregated server-side
+# into one row
+_POOL_SUMMARY_STMT = text("""
+    WITH avail AS (
+        SELECT role, COUNT(*) AS count
+        FROM certa_users
+        WHERE is_locked = false
+          AND is_healthy = true
+        GROUP BY role
+    ),
+    execs AS (
+        SELECT status, COUNT(*) AS count
+        FROM certa_test_executions
+        GROUP BY status
+    )
+    SELECT
+        COALESCE((SELECT jsonb_object_agg(role, count) FROM avail), '{}'::jsonb) AS availability,
+        COALESCE((SELECT jsonb_object_agg(status, count) FROM execs), '{}'::jsonb) AS executions
+""").columns(availability=JSONB, executions=JSONB)
+
 
 class UserPoolService:
-    def __init__(self, session: Session):
+    def __init__(self, session: AsyncSession):
         self.session = session
         self.user_repo = UserRepository(session)
         self.test_exec_repo = TestExecutionRepository(session)
+        # Per-instance RNG for backoff jitter (keeps off the module-level generator)
+        self._rng = random.Random()
     
-    def acquire_users(
+    async def acquire_users(
         self,
         test_execution_id: str,
         role_requirements: Dict[str, int],
@@ -43,78 +74,91 @@ class UserPoolService:
         if max_retries is None:
             max_retries = settings.default_max_retries
         
-        # Create test execution record
-        test_execution = self.test_exec_repo.create_execution(
+        # Create test execution record; when users are free it commits
+        # together with them in a single transaction
+        test_execution = await self.test_exec_repo.create_execution(
             test_execution_id=test_execution_id,
             requested_roles=role_requirements
         )
-        self.session.commit()
+        
+        # Normalise requirements once; every attempt binds the same arrays
+        roles = sorted(role_requirements)
+        counts = [role_requirements[role] for role in roles]
         
         # Attempt acquisition with retries
-        for attempt in range(max_retries):
-            try:
-                acquired_users = self._attempt_acquisition(
-                    test_execution_id=test_execution_id,
-                    role_requirements=role_requirements
-                )
-                
-                # Success - mark as running
-                test_execution.mark_running()
-                self.session.commit()
-                
-                return acquired_users
-                
-            except InsufficientUsersException as e:
-                if attempt < max_retries - 1:
-                    # Wait with exponential backoff + jitter
-                    wait_time = self._calculate_backoff(attempt)
-                    time.sleep(wait_time)
-                else:
-                    # Final attempt failed
-                    test_execution.mark_failed()
-                    self.session.commit()
-                    raise UserAcquisitionTimeoutException(
-                        f"Could not acquire users after {max_retries} attempts: {e}"
+        pubsub = None
+        try:
+            for attempt in range(max_retries):
+                try:
+                    acquired_users = await self._attempt_acquisition(
+                        test_execution_id=test_execution_id,
+                        roles=roles,
+                        counts=counts
                     )
+                    
+                    # Success - mark as running
+                    test_execution.mark_running()
+                    await self.session.commit()
+                    
+                    return acquired_users
+                    
+                except InsufficientUsersException as e:
+                    if attempt < max_retries - 1:
+                        # Persist the ACQUIRING row and hand the connection back
+                        # to the pool; holding it while waiting can starve the
+                        # release that would wake us
+                        await self.session.commit()
+                        
+                        # Wait for a release, bounded by exponential backoff + jitter
+                        if pubsub is None:
+                            pubsub = await self._subscribe_releases()
+                        wait_time = self._calculate_backoff(attempt)
+                        await self._wait_for_release(pubsub, wait_time)
+                    else:
+                        # Final attempt failed
+                        test_execution.mark_failed()
+                        await self.session.commit()
+                        raise UserAcquisitionTimeoutException(
+                            f"Could not acquire users after {max_retries} attempts: {e}"
+                        )
+        finally:
+            if pubsub is not None:
+                await pubsub.aclose()
         
         raise UserAcquisitionTimeoutException("Unexpected error in user acquisition")
     
-    def _attempt_acquisition(
+    async def _attempt_acquisition(
         self,
         test_execution_id: str,
-        role_requirements: Dict[str, int]
+        roles: List[str],
+        counts: List[int]
     ) -> List[CertaUser]:
-        """Single acquisition attempt"""
-        acquired_users = []
-        
-        try:
-            for role, count in role_requirements.items():
-                users = self.user_repo.acquire_users_atomic(
-                    role=role,
-                    count=count,
-                    test_execution_id=test_execution_id
-                )
-                
-                if len(users) < count:
-                    # Not enough users, rollback
-                    self.session.rollback()
+        """
+        Single acquisition attempt (one statement across all roles)
+        Runs in a savepoint so a shortfall rolls back only this attempt's
+        row locks, not the execution record; the caller commits
+        """
+        async with self.session.begin_nested():
+            acquired_users = await self.user_repo.acquire_users_multi_role(
+                roles=roles,
+                counts=counts,
+                test_execution_id=test_execution_id
+            )
+            
+            acquired_by_role = Counter(user.role for user in acquired_users)
+            for role, count in zip(roles, counts):
+                if acquired_by_role[role] < count:
+                    # Not enough users; leaving the block rolls back to the savepoint
                     raise InsufficientUsersException(
                         message=f"Insufficient {role} users",
                         role=role,
                         required=count,
-                        available=len(users)
+                        available=acquired_by_role[role]
                     )
-                
-                acquired_users.extend(users)
-            
-            self.session.commit()
-            return acquired_users
-            
-        except Exception as e:
-            self.session.rollback()
-            raise
+        
+        return acquired_users
     
-    def release_users(self, test_execution_id: str) -> int:
+    async def release_users(self, test_execution_id: str) -> int:
         """
         Release all users locked by a test execution
         
@@ -124,24 +168,85 @@ class UserPoolService:
         Returns:
             Number of users released
         """
-        released_count = self.user_repo.release_by_test_execution(test_execution_id)
+        released_count = await self.user_repo.release_by_test_execution(test_execution_id)
         
         # Update test execution status
-        test_execution = self.test_exec_repo.get_by_id(test_execution_id)
+        test_execution = await self.test_exec_repo.get_by_id(test_execution_id)
         if test_execution:
             test_execution.mark_completed()
         
-        self.session.commit()
+        await self.session.commit()
+        
+        if released_count:
+            await self._notify_release(test_execution_id)
         
         return released_count
     
-    def get_availability(self) -> Dict[str, int]:
+    async def get_availability(self) -> Dict[str, int]:
         """Get availability count by role"""
-        return self.user_repo.get_availability_by_role()
+        return await self.user_repo.get_availability_by_role()
+    
+    async def get_pool_summary(self) -> Dict[str, Dict[str, int]]:
+        """Get availability by role and execution counts by status in one query"""
+        result = await self.session.execute(_POOL_SUMMARY_STMT)
+        availability, executions = result.one()
+        return {
+            "availability": availability,
+            # Status is stored by enum name; expose the API-facing values
+            "executions": {
+                TestExecutionStatus[name].value: count
+                for name, count in executions.items()
+            }
+        }
+    
+    @staticmethod
+    async def _subscribe_releases() -> Optional[PubSub]:
+        """Subscribe to release notifications (None if Redis is unconfigured or unavailable)"""
+        redis = get_redis()
+        if redis is None:
+            return None
+        
+        pubsub = redis.pubsub()
+        try:
+            await pubsub.subscribe(POOL_RELEASE_CHANNEL)
+        except RedisError as e:
+            log_redis_error("Release notifications unavailable, falling back to backoff", e)
+            await pubsub.aclose()
+            return None
+        return pubsub
     
     @staticmethod
-    def _calculate_backoff(attempt: int) -> float:
+    async def _wait_for_release(pubsub: Optional[PubSub], timeout: float) -> None:
+        """Block until a release is published or the timeout elapses"""
+        if pubsub is None:
+            await asyncio.sleep(timeout)
+            return
+        
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        try:
+            while (remaining := deadline - loop.time()) > 0:
+                # Subscribe confirmations come back as None; keep waiting
+                message = await pubsub.get_message(ignore_subscribe_messages=True, timeout=remaining)
+                if message is not None:
+                    return
+        except RedisError as e:
+            log_redis_error("Release notification wait failed", e)
+            await asyncio.sleep(max(deadline - loop.time(), 0))
+    
+    @staticmethod
+    async def _notify_release(test_execution_id: str) -> None:
+        """Wake acquisitions waiting for users"""
+        redis = get_redis()
+        if redis is None:
+            return
+        try:
+            await redis.publish(POOL_RELEASE_CHANNEL, test_execution_id)
+        except RedisError as e:
+            log_redis_error(f"Could not publish release of {test_execution_id}", e)
+    
+    def _calculate_backoff(self, attempt: int) -> float:
         """Calculate exponential backoff with jitter"""
         base_wait = min(2 ** attempt, settings.max_retry_wait_seconds)
-        jitter = random.uniform(0.5, 1.5)
+        jitter = self._rng.uniform(0.5, 1.5)
         return base_wait * jitter
\ No newline at end of file
@@ -1,4 +1,4 @@
-from sqlalchemy import Boolean, Column, String, BigInteger, DateTime, Text
+from sqlalchemy import Boolean, Column, String, BigInteger, DateTime, Text, Index, text
 from sqlalchemy.sql import func
 from core.database import Base
 from datetime import datetime
@@ -6,15 +6,30 @@ from typing import Optional
 
 class CertaUser(Base):
     __tablename__ = "certa_users"
+    # Fetch server-generated columns (created_at, updated_at) in the same
+    # statement so async sessions never need a lazy refresh
+    __mapper_args__ = {"eager_defaults": True}
+    __table_args__ = (
+        # Pool scans: availability by role, list filters
+        Index("ix_certa_users_role_is_healthy_is_locked", "role", "is_healthy", "is_locked"),
+        # Acquisition scan: matches the SKIP LOCKED subquery predicate and ordering
+        Index(
+            "ix_certa_users_acquire",
+            "role", "is_locked", "is_healthy", text("locked_at NULLS FIRST"),
+            postgresql_where=text("is_locked = false AND is_healthy = true"),
+        ),
+        # Users assigned to an execution; unlocked rows are left out of the index
+        Index("ix_certa_users_locked_by", "locked_by", postgresql_where=text("locked_by IS NOT NULL")),
+    )
 
     id = Column(BigInteger, primary_key=True, index=True)
     email = Column(Text, nullable=False, unique=True)
     password = Column(Text, nullable=False)
-    role = Column(Text, nullable=False, index=True)
+    role = Column(Text, nullable=False)
     tenant = Column(Text)
     domain = Column(Text)
     tags = Column(Text)
-    is_locked = Column(Boolean, default=False, nullable=False, index=True)
+    is_locked = Column(Boolean, default=False, nullable=False)
     is_healthy = Column(Boolean, default=True, nullable=False)
     locked_by = Column(String(255), nullable=True)
     locked_at = Column(DateTime(timezone=True), nullable=True)
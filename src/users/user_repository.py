@@ -1,93 +1,117 @@
 from typing import List, Dict
-from sqlalchemy import text
-from sqlalchemy.orm import Session
+from sqlalchemy import func, select, text, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
 from core.repository import BaseRepository
 from src.users.user_models import CertaUser
 
+# Built once so SQLAlchemy's compiled-statement cache is hit on every call
+_AVAIL_STMT = (
+    select(CertaUser.role, func.count().label('count'))
+    .where(CertaUser.is_locked == False, CertaUser.is_healthy == True)
+    .group_by(CertaUser.role)
+)
+
 
 class UserRepository(BaseRepository):
-    def __init__(self, session: Session):
+    def __init__(self, session: AsyncSession):
         super().__init__(CertaUser, session)
     
-    def get_available_by_role(self, role: str, limit: int) -> List[CertaUser]:
+    async def get_available_by_role(self, role: str, limit: int) -> List[CertaUser]:
         """Get available users by role"""
-        return (
-            self.session.query(CertaUser)
-            .filter(
+        result = await self.session.execute(
+            select(CertaUser)
+            .where(
                 CertaUser.role == role,
                 CertaUser.is_locked == False,
                 CertaUser.is_healthy == True
             )
             .order_by(CertaUser.locked_at.nullsfirst())
             .limit(limit)
-            .all()
         )
+        return result.scalars().all()
+    
+    async def create_many(
+        self,
+        users: List[dict],
+        skip_existing: bool = False
+    ) -> List[CertaUser]:
+        """
+        Insert users with one multi-row INSERT ... RETURNING
+        With skip_existing, rows whose email already exists are ignored
+        (ON CONFLICT DO NOTHING) and only inserted users are returned
+        """
+        stmt = insert(CertaUser).values(users)
+        if skip_existing:
+            stmt = stmt.on_conflict_do_nothing(index_elements=[CertaUser.email])
+        
+        result = await self.session.execute(stmt.returning(CertaUser))
+        return result.scalars().all()
     
-    def acquire_users_atomic(
+    async def acquire_users_multi_role(
         self,
-        role: str,
-        count: int,
+        roles: List[str],
+        counts: List[int],
         test_execution_id: str
     ) -> List[CertaUser]:
         """
-        Atomically acquire users using FOR UPDATE SKIP LOCKED
-        Returns acquired users or empty list if insufficient
+        Atomically acquire users for every role in one statement
+        roles and counts are parallel lists (counts[i] users of roles[i])
+        Each role is picked by its own LATERAL FOR UPDATE SKIP LOCKED scan;
+        callers compare per-role counts against the requirements
         """
-        result = self.session.execute(
-            text("""
+        stmt = (
+            select(CertaUser)
+            .from_statement(text("""
+                WITH wanted AS (
+                    SELECT *
+                    FROM unnest(CAST(:roles AS text[]), CAST(:counts AS integer[])) AS w(role, count)
+                ),
+                picked AS (
+                    SELECT candidate.id
+                    FROM wanted
+                    CROSS JOIN LATERAL (
+                        SELECT id
+                        FROM certa_users
+                        WHERE role = wanted.role
+                          AND is_locked = false
+                          AND is_healthy = true
+                        ORDER BY locked_at NULLS FIRST
+                        LIMIT wanted.count
+                        FOR UPDATE SKIP LOCKED
+                    ) AS candidate
+                )
                 UPDATE certa_users 
                 SET is_locked = true,
                     locked_by = :test_id,
-                    locked_at = NOW()
-                WHERE id IN (
-                    SELECT id 
-                    FROM certa_users 
-                    WHERE role = :role 
-                      AND is_locked = false
-                      AND is_healthy = true
-                    ORDER BY locked_at NULLS FIRST
-                    LIMIT :count
-                    FOR UPDATE SKIP LOCKED
-                )
-                RETURNING id
-            """),
+                    locked_at = NOW(),
+                    updated_at = NOW()
+                WHERE id IN (SELECT id FROM picked)
+                RETURNING *
+            """))
+            .execution_options(populate_existing=True)
+        )
+        result = await self.session.execute(
+            stmt,
             {
                 "test_id": test_execution_id,
-                "role": role,
-                "count": count
+                "roles": roles,
+                "counts": counts
             }
         )
-        
-        user_ids = [row.id for row in result.fetchall()]
-        
-        if not user_ids:
-            return []
-        
-        return self.session.query(CertaUser).filter(CertaUser.id.in_(user_ids)).all()
+        return result.scalars().all()
     
-    def release_by_test_execution(self, test_execution_id: str) -> int:
+    async def release_by_test_execution(self, test_execution_id: str) -> int:
         """Release all users locked by a test execution"""
-        result = self.session.execute(
-            text("""
-                UPDATE certa_users 
-                SET is_locked = false,
-                    locked_by = NULL,
-                    locked_at = NULL
-                WHERE locked_by = :test_id
-            """),
-            {"test_id": test_execution_id}
+        result = await self.session.execute(
+            update(CertaUser)
+            .where(CertaUser.locked_by == test_execution_id)
+            .values(is_locked=False, locked_by=None, locked_at=None, updated_at=func.now())
+            .execution_options(synchronize_session=False)
         )
         return result.rowcount
     
-    def get_availability_by_role(self) -> Dict[str, int]:
+    async def get_availability_by_role(self) -> Dict[str, int]:
         """Get count of available users by role"""
-        result = self.session.execute(
-            text("""
-                SELECT role, COUNT(*) as count
-                FROM certa_users
-                WHERE is_locked = false
-                  AND is_healthy = true
-                GROUP BY role
-            """)
-        )
-        return {row.role: row.count for row in result.fetchall()}
\ No newline at end of file
+        result = await self.session.execute(_AVAIL_STMT)
+        return dict(result.tuples().all())
\ No newline at end of file
@@ -1,6 +1,6 @@
-from pydantic import BaseModel, Field, EmailStr, ConfigDict
+from pydantic import BaseModel, Field, EmailStr, ConfigDict, TypeAdapter
 from datetime import datetime
-from typing import Optional
+from typing import List, Optional
 
 
 class CertaUserBase(BaseModel):
@@ -39,6 +39,16 @@ class CertaUserResponse(CertaUserBase):
     updated_at: Optional[datetime] = None
 
 
+# Validates/serializes whole result lists in one pass
+CertaUserListAdapter = TypeAdapter(List[CertaUserResponse])
+
+
+class CertaUserPage(BaseModel):
+    """Keyset-paginated users; pass next_cursor back as `cursor`"""
+    items: List[CertaUserResponse]
+    next_cursor: Optional[int] = None
+
+
 class CertaUserAvailability(BaseModel):
     role: str
     available_count: int